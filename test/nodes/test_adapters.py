@@ -58,6 +58,11 @@ class TestIterableWrapper(TestCase):
     def test_save_load_state_stateful(self, midpoint: int):
         run_test_save_load_state(self, IterableWrapper(StatefulRange(10)), midpoint)
 
+    def test_fast_forward_past_end(self):
+        node = IterableWrapper(range(10))
+        with self.assertRaisesRegex(ValueError, "hit StopIteration after 10 items"):
+            node.reset({IterableWrapper.NUM_YIELDED_KEY: 15})
+
 
 class TestMapStyle(TestCase):
     def test_default_sampler(self):
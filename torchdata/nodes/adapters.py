@@ -4,6 +4,8 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import collections
+import itertools
 
 from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, TypeVar
 
@@ -18,6 +20,22 @@ from .types import Stateful
 K = TypeVar("K", covariant=True)
 
 
+def _fast_forward(it: Iterator, n: int) -> None:
+    """Consume n items from it without a python-level loop per item.
+
+    zip() pulls from the islice before the counter, so the counter only advances
+    for items that were actually consumed.
+    """
+    counter = itertools.count()
+    collections.deque(zip(itertools.islice(it, n), counter), maxlen=0)
+    consumed = next(counter)
+    if consumed < n:
+        raise ValueError(
+            f"Tried to fast-forward {n} items during init but "
+            f"hit StopIteration after {consumed} items, this is likely a bug or malformed state_dict"
+        )
+
+
 class IterableWrapper(BaseNode[T]):
     """Thin Wrapper that converts any Iterable (including
     torch.utils.data.IterableDataset) in to a BaseNode.
@@ -52,14 +70,7 @@ class IterableWrapper(BaseNode[T]):
             else:
                 self._it = iter(self.iterable)
                 # Naively fast-forwarding
-                for i in range(self._num_yielded):
-                    try:
-                        next(self._it)
-                    except StopIteration:
-                        raise ValueError(
-                            f"Tried to fast-forward {self._num_yielded} items during init but "
-                            f"hit StopIteration after {i} items, this is likely a bug or malformed state_dict"
-                        )
+                _fast_forward(self._it, self._num_yielded)  # type: ignore [arg-type]
         else:
             self._it = iter(self.iterable)
 
@@ -130,14 +141,7 @@ class SamplerWrapper(BaseNode[T]):
                 if hasattr(self.sampler, "set_epoch"):
                     self.sampler.set_epoch(self.epoch)
                 self._it = iter(self.sampler)
-                for i in range(self._num_yielded):
-                    try:
-                        next(self._it)  # type: ignore [arg-type]
-                    except StopIteration:
-                        raise ValueError(
-                            f"Tried to fast-forward {self._num_yielded} items during init but "
-                            f"hit StopIteration after {i} items, this is likely a bug or malformed state_dict"
-                        )
+                _fast_forward(self._it, self._num_yielded)  # type: ignore [arg-type]
         else:
             self._num_yielded = 0
             if self._started: